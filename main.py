@@ -1,20 +1,72 @@
+import asyncio
+import functools
+import itertools
 import logging
 import os
+import random
+import re
+import stat
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TypeVar
 
 import httpx
+import msgpack
+import orjson
 from mcp.server.fastmcp import FastMCP
 
-# Initialize FastMCP server
-mcp = FastMCP("leetcodemcp")
+try:
+    import fcntl
+except ImportError:  # Windows: cache files are then only locked within this process
+    fcntl = None
 
 LANGUAGE = os.getenv("LANGUAGE", "zh-CN")
 
 # Constants
-LEET_CODE_API_BASE = "https://leetcode.cn/graphql/"
+LEET_CODE_BASE_URL = "https://leetcode.cn"
+# Every request targets the same origin, so concurrent calls share one multiplexed HTTP/2 connection
+LEET_CODE_GRAPHQL_PATH = "/graphql/"
 WANTED_AUTHORS = [("宫水三叶", "ac_oier"), ("灵茶山艾府", "endlesscheng")]
-
-QUESTION_DESC_QUERY = """
+_WANTED_PROFILES = ({("realName", author_name) for author_name, _ in WANTED_AUTHORS}
+                    | {("userSlug", author_slug) for _, author_slug in WANTED_AUTHORS})
+DESC_CACHE_SIZE = 512
+# Static headers set once on the client. Bodies are serialized with orjson, so the
+# content type is not filled in by httpx.
+_REQUEST_HEADERS = {"content-type": "application/json",
+                    "accept": "application/json",
+                    "accept-encoding": "gzip"}
+# Failures the handlers turn into a fallback message: transport errors and bodies that
+# are not JSON objects. Fields inside the body are read through _field, so malformed
+# upstream data reads as missing instead of raising. Anything else, notably
+# asyncio.CancelledError, propagates so cancelled fan-out tasks stop promptly.
+_FETCH_ERRORS = (httpx.HTTPError, KeyError, ValueError, TypeError)
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "leetcodemcp"
+# Seconds between folding the append-only cache logs into their snapshots
+CACHE_COMPACT_INTERVAL = 300
+_CACHE_FILE_LOCK = threading.Lock()
+_CACHE_RECORD_MARKER = b"LCMR"
+# Marker, payload length, payload CRC32
+_CACHE_RECORD_HEADER = struct.Struct(">4sII")
+MAX_RETRIES = 3
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+PAGE_SIZE = 100
+# Number of question list pages requested concurrently while searching for a slug
+PAGE_WINDOW = 4
+
+def _compact(query: str) -> str:
+    """Collapse a GraphQL document's whitespace; the queries here contain no string literals."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
+QUESTION_DESC_QUERY = _compact("""
 query questionContent($titleSlug: String!) {
   question(titleSlug: $titleSlug) {
     content
@@ -23,18 +75,19 @@ query questionContent($titleSlug: String!) {
     dataSchemas
   }
 }
-"""
+""")
 
-QUESTION_DESC_CN_QUERY = """
+QUESTION_DESC_CN_QUERY = _compact("""
 query questionTranslations($titleSlug: String!) {
   question(titleSlug: $titleSlug) {
     translatedTitle
     translatedContent
   }
 }
-"""
+""")
 
-QUESTION_KEYWORDS_QUERY = """
+# Slug lookup only reads these fields, so it skips the heavy per-question payload
+QUESTION_KEYWORDS_SLIM_QUERY = _compact("""
 query problemsetQuestionListV2($filters: QuestionFilterInput, $limit: Int, $searchKeyword: String, $skip: Int, $sortBy: QuestionSortByInput, $categorySlug: String) {
   problemsetQuestionListV2(
     filters: $filters
@@ -45,105 +98,15 @@ query problemsetQuestionListV2($filters: QuestionFilterInput, $limit: Int, $sear
     categorySlug: $categorySlug
   ) {
     questions {
-      id
       titleSlug
-      title
-      translatedTitle
       questionFrontendId
-      paidOnly
-      difficulty
-      topicTags {
-        name
-        slug
-        nameTranslated
-      }
-      status
-      isInMyFavorites
-      frequency
-      acRate
-      contestPoint
     }
-    totalLength
-    finishedLength
     hasMore
   }
 }
-"""
-
-QUESTION_SOLUTION_ARTICLE_QUERY = """
-    query questionTopicsList($questionSlug: String!, $skip: Int, $first: Int, $orderBy: SolutionArticleOrderBy, $userInput: String, $tagSlugs: [String!]) {
-  questionSolutionArticles(
-    questionSlug: $questionSlug
-    skip: $skip
-    first: $first
-    orderBy: $orderBy
-    userInput: $userInput
-    tagSlugs: $tagSlugs
-  ) {
-    totalNum
-    edges {
-      node {
-        rewardEnabled
-        canEditReward
-        uuid
-        title
-        slug
-        sunk
-        chargeType
-        status
-        identifier
-        canEdit
-        canSee
-        reactionType
-        hasVideo
-        favoriteCount
-        upvoteCount
-        reactionsV2 {
-          count
-          reactionType
-        }
-        tags {
-          name
-          nameTranslated
-          slug
-          tagType
-        }
-        createdAt
-        thumbnail
-        author {
-          username
-          certificationLevel
-          profile {
-            userAvatar
-            userSlug
-            realName
-            reputation
-          }
-        }
-        summary
-        topic {
-          id
-          commentCount
-          viewCount
-          pinned
-        }
-        byLeetcode
-        isMyFavorite
-        isMostPopular
-        isEditorsPick
-        hitCount
-        videosInfo {
-          videoId
-          coverUrl
-          duration
-        }
-      }
-    }
-  }
-}
-    """
+""")
 
-QUESTION_SOLUTION_ARTICLE_CONTENT_QUERY = """
+QUESTION_SOLUTION_ARTICLE_CONTENT_QUERY = _compact("""
     query discussTopic($slug: String) {
   solutionArticle(slug: $slug, orderBy: DEFAULT) {
     ...solutionArticle
@@ -228,60 +191,464 @@ QUESTION_SOLUTION_ARTICLE_CONTENT_QUERY = """
     questionFrontendId
   }
 }
+    """)
+
+# Never mutated, so every question list request can share it
+_EMPTY_FILTERS = {
+    "filterCombineType": "ALL",
+    "statusFilter": {
+        "questionStatuses": [],
+        "operator": "IS"
+    },
+    "difficultyFilter": {
+        "difficulties": [],
+        "operator": "IS"
+    },
+    "languageFilter": {
+        "languageSlugs": [],
+        "operator": "IS"
+    },
+    "topicFilter": {
+        "topicSlugs": [],
+        "operator": "IS"
+    },
+    "acceptanceFilter": {},
+    "frequencyFilter": {},
+    "frontendIdFilter": {},
+    "lastSubmittedFilter": {},
+    "publishedFilter": {},
+    "companyFilter": {
+        "companySlugs": [],
+        "operator": "IS"
+    },
+    "positionFilter": {
+        "positionSlugs": [],
+        "operator": "IS"
+    },
+    "contestPointFilter": {
+        "contestPoints": [],
+        "operator": "IS"
+    },
+    "premiumFilter": {
+        "premiumStatus": [],
+        "operator": "IS"
+    }
+}
+
+_PROBLEM_ID_REPLACEMENTS = {"JZ_Offer": "剑指Offer", "Interview": "面试题", "__": ".", "_": " "}
+# Alternatives are tried left to right, so the longer tokens must come before "_"
+_PROBLEM_ID_RE = re.compile(r"JZ_Offer|Interview|__|_")
+
+# Question list variables that are identical for every page
+_BASE_PAGE_VARIABLES = {"categorySlug": "all-code-essentials", "limit": PAGE_SIZE, "filters": _EMPTY_FILTERS}
+
+if LANGUAGE == "zh-CN":
+    _DESC_QUERY, _DESC_OPERATION, _DESC_KEY = QUESTION_DESC_CN_QUERY, "questionTranslations", "translatedContent"
+else:
+    _DESC_QUERY, _DESC_OPERATION, _DESC_KEY = QUESTION_DESC_QUERY, "questionContent", "content"
+
+_AUTHOR_ARTICLES_FIELD = """
+  articles{i}: questionSolutionArticles(
+    questionSlug: $titleSlug
+    skip: 0
+    first: 15
+    orderBy: DEFAULT
+    userInput: $author{i}
+    tagSlugs: []
+  ) {{
+    edges {{
+      node {{
+        slug
+        author {{
+          profile {{
+            userSlug
+            realName
+          }}
+        }}
+      }}
+    }}
+  }}"""
+
+# Description plus one aliased article listing per wanted author, so both come back in a single POST
+QUESTION_DESC_AND_ARTICLES_QUERY = _compact(f"""
+query questionDescAndArticles($titleSlug: String!, {", ".join(f"$author{i}: String" for i in range(len(WANTED_AUTHORS)))}) {{
+  question(titleSlug: $titleSlug) {{
+    {_DESC_KEY}
+  }}{"".join(_AUTHOR_ARTICLES_FIELD.format(i=i) for i in range(len(WANTED_AUTHORS)))}
+}}
+""")
+_AUTHOR_VARIABLES = {f"author{i}": author_name for i, (author_name, _) in enumerate(WANTED_AUTHORS)}
+
+T = TypeVar("T")
+
+# Resources shared by every tool call. The client is built by the server lifespan
+# (or lazily, when the tools are called outside of a running server). The caches only
+# hold successful lookups, so a transient failure is retried on the next call.
+STATE = SimpleNamespace(
+    client=None,
+    sem=asyncio.Semaphore(8),
+    slug_cache={},
+    desc_cache=OrderedDict(),
+    inflight={},
+    pending_records={},
+    flush_task=None,
+)
+
+
+def _client() -> httpx.AsyncClient:
+    """Return the shared client, so every tool call reuses pooled keep-alive connections."""
+    if STATE.client is None or STATE.client.is_closed:
+        STATE.client = httpx.AsyncClient(base_url=LEET_CODE_BASE_URL,
+                                         http2=True,
+                                         headers=_REQUEST_HEADERS,
+                                         # Store no cookies, like the per-call clients this replaced
+                                         cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                                         follow_redirects=False,
+                                         timeout=httpx.Timeout(connect=2.0, read=5.0, write=2.0, pool=1.0),
+                                         limits=httpx.Limits(max_keepalive_connections=20, max_connections=100))
+    return STATE.client
+
+
+async def _post(query_json: dict) -> dict:
+    """POST a GraphQL payload to LeetCode and return the decoded response object.
+
+    Rate-limit and gateway errors are retried with jittered exponential backoff.
+    A body that is not a JSON object raises ValueError.
+    """
+    content = orjson.dumps(query_json)
+    for attempt in range(MAX_RETRIES + 1):
+        async with STATE.sem:
+            resp = await _client().post(LEET_CODE_GRAPHQL_PATH, content=content)
+        if resp.status_code not in _RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(0.2 * 2 ** attempt + 0.1 * random.random())
+    resp.raise_for_status()
+    body = orjson.loads(resp.content)
+    if not isinstance(body, dict):
+        # e.g. `null` or a list from an error page; the handlers treat this like any other bad response
+        raise ValueError(f"Unexpected GraphQL response body: {type(body).__name__}")
+    return body
+
+def _field(value: object, *keys: str) -> object:
+    """Walk nested response objects, yielding None where a level is missing, null or not an object."""
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+def _text(value: object) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _coalesced(operation: str) -> Callable[[Callable[[str], Awaitable[T]]], Callable[[str], Awaitable[T]]]:
     """
+    Share one in-flight fetch between concurrent callers asking for the same key.
+
+    The fetch runs as its own task and callers await it through asyncio.shield, so a
+    cancelled caller does not cancel the result the other callers are waiting on. Once
+    the last waiting caller is cancelled, the fetch itself is cancelled too.
+    """
+    def decorator(fetch: Callable[[str], Awaitable[T]]) -> Callable[[str], Awaitable[T]]:
+        @functools.wraps(fetch)
+        async def wrapper(arg: str) -> T:
+            key = (operation, arg, LANGUAGE)
+            entry = STATE.inflight.get(key)
+            if entry is None:
+                entry = SimpleNamespace(task=asyncio.ensure_future(fetch(arg)), waiters=0)
+                STATE.inflight[key] = entry
+                entry.task.add_done_callback(lambda _: _forget_inflight(key, entry))
+            entry.waiters += 1
+            try:
+                return await asyncio.shield(entry.task)
+            finally:
+                entry.waiters -= 1
+                if not entry.waiters and not entry.task.done():
+                    # Every caller gave up; drop the entry first so new callers start a fresh fetch
+                    _forget_inflight(key, entry)
+                    entry.task.cancel()
+        return wrapper
+    return decorator
+
+def _forget_inflight(key: tuple, entry: SimpleNamespace) -> None:
+    if STATE.inflight.get(key) is entry:
+        del STATE.inflight[key]
+
+
+# On-disk caches are a snapshot (<name>.snapshot) plus an append-only log (<name>.log). Both
+# hold framed records: a marker, the payload length and its CRC32, then a msgpack (key, value)
+# payload. Compaction folds the log into a new snapshot.
+def _pack_cache_record(key: str | tuple[str, str], value: str) -> bytes:
+    payload = msgpack.packb((key, value))
+    return _CACHE_RECORD_HEADER.pack(_CACHE_RECORD_MARKER, len(payload), zlib.crc32(payload)) + payload
+
+def _is_cache_record(record: object) -> bool:
+    if not (isinstance(record, tuple) and len(record) == 2 and isinstance(record[1], str)):
+        return False
+    key = record[0]
+    return isinstance(key, str) or (isinstance(key, tuple) and len(key) == 2
+                                    and all(isinstance(part, str) for part in key))
+
+def _read_cache_records(path: Path) -> Iterator[tuple[str | tuple[str, str], str]]:
+    """
+    Yield the valid records of a cache file. A record torn by a crash mid-append is skipped
+    by scanning for the next marker, so records appended after it are still read.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return
+    except OSError:
+        logging.warning(f"Ignoring unreadable cache file: {path}", exc_info=True)
+        return
+    skipped = 0
+    offset = data.find(_CACHE_RECORD_MARKER)
+    while offset != -1:
+        start = offset + _CACHE_RECORD_HEADER.size
+        if start <= len(data):
+            _, length, crc = _CACHE_RECORD_HEADER.unpack_from(data, offset)
+            payload = data[start:start + length]
+            if len(payload) == length and zlib.crc32(payload) == crc:
+                try:
+                    record = msgpack.unpackb(payload, raw=False, use_list=False)
+                except (ValueError, msgpack.UnpackException):
+                    record = None
+                if _is_cache_record(record):
+                    yield record
+                else:
+                    skipped += 1
+                offset = data.find(_CACHE_RECORD_MARKER, start + length)
+                continue
+        skipped += 1
+        offset = data.find(_CACHE_RECORD_MARKER, offset + 1)
+    if skipped:
+        logging.warning(f"Skipped {skipped} damaged record(s) in cache file: {path}")
+
+@contextmanager
+def _cache_file_lock(name: str) -> Iterator[None]:
+    """
+    Serialize access to one cache's files. Every MCP server process shares CACHE_DIR, so
+    where fcntl is available an exclusive flock guards against other processes too.
+    """
+    with _CACHE_FILE_LOCK:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with (CACHE_DIR / f"{name}.lock").open("wb") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+def _load_cache(name: str) -> dict:
+    entries = {}
+    try:
+        with _cache_file_lock(name):
+            for suffix in (".snapshot", ".log"):
+                for key, value in _read_cache_records(CACHE_DIR / f"{name}{suffix}"):
+                    entries[key] = value
+    except OSError:
+        logging.warning(f"Error loading {name} cache", exc_info=True)
+    return entries
+
+def _append_cache_records(name: str, records: list[tuple[str | tuple[str, str], str]]) -> None:
+    try:
+        with _cache_file_lock(name):
+            with (CACHE_DIR / f"{name}.log").open("ab") as f:
+                f.write(b"".join(_pack_cache_record(key, value) for key, value in records))
+    except OSError:
+        logging.warning(f"Error persisting {name} cache entries", exc_info=True)
+
+def _persist_cache_record(name: str, key: str | tuple[str, str], value: str) -> None:
+    """Queue a record for the on-disk log; a single flush task writes batches off the event loop."""
+    STATE.pending_records.setdefault(name, []).append((key, value))
+    if STATE.flush_task is None or STATE.flush_task.done():
+        STATE.flush_task = asyncio.create_task(_flush_cache_records())
+
+async def _flush_cache_records() -> None:
+    while STATE.pending_records:
+        batch, STATE.pending_records = STATE.pending_records, {}
+        for name, records in batch.items():
+            await asyncio.to_thread(_append_cache_records, name, records)
+
+def _cache_desc(slug: str, desc: str, persist: bool = True) -> None:
+    key = (slug, LANGUAGE)
+    changed = STATE.desc_cache.get(key) != desc
+    STATE.desc_cache[key] = desc
+    STATE.desc_cache.move_to_end(key)
+    if len(STATE.desc_cache) > DESC_CACHE_SIZE:
+        STATE.desc_cache.popitem(last=False)
+    # The solution lookup re-delivers descriptions on every call; only log new or changed ones
+    if persist and changed:
+        _persist_cache_record("descs", key, desc)
+
+def _compact_cache(name: str) -> None:
+    log_path = CACHE_DIR / f"{name}.log"
+    snapshot_path = CACHE_DIR / f"{name}.snapshot"
+    # Appends wait on the lock, so nothing written to the log can slip in between folding and unlinking it
+    with _cache_file_lock(name):
+        if not log_path.exists():
+            return
+        entries = {}
+        for path in (snapshot_path, log_path):
+            for key, value in _read_cache_records(path):
+                entries[key] = value
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=f"{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"".join(_pack_cache_record(key, value) for key, value in entries.items()))
+            os.replace(tmp_path, snapshot_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        log_path.unlink()
+
+def _compact_caches() -> None:
+    for name in ("slugs", "descs"):
+        try:
+            _compact_cache(name)
+        except OSError:
+            logging.warning(f"Error compacting {name} cache", exc_info=True)
+
+async def _compact_caches_periodically() -> None:
+    while True:
+        await asyncio.sleep(CACHE_COMPACT_INTERVAL)
+        await asyncio.to_thread(_compact_caches)
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    _client()
+    STATE.slug_cache.update(await asyncio.to_thread(_load_cache, "slugs"))
+    for (slug, language), desc in (await asyncio.to_thread(_load_cache, "descs")).items():
+        if language == LANGUAGE:
+            _cache_desc(slug, desc, persist=False)
+    compaction = asyncio.create_task(_compact_caches_periodically())
+    try:
+        yield
+    finally:
+        compaction.cancel()
+        if STATE.flush_task is not None:
+            await STATE.flush_task
+        await asyncio.to_thread(_compact_caches)
+        if STATE.client is not None:
+            await STATE.client.aclose()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("leetcodemcp", lifespan=_lifespan)
+
 
 def _folder_name_to_problem_id(folder_name: str) -> str:
-    question_id = folder_name[folder_name.find("_") + 1:]
-    if "__" in question_id:
-        question_id = question_id.replace("__", ".")
-    if "_" in question_id:
-        question_id = question_id.replace("_", " ")
-    if "JZ_Offer" in question_id:
-        question_id = question_id.replace("JZ_Offer", "剑指Offer")
-    if "Interview" in question_id:
-        question_id = question_id.replace("Interview", "面试题")
-    return question_id
+    prefix, sep, question_id = folder_name.partition("_")
+    if not sep:
+        question_id = prefix
+    return _PROBLEM_ID_RE.sub(lambda m: _PROBLEM_ID_REPLACEMENTS[m.group(0)], question_id)
 
-async def _get_leetcode_question_desc_by_slug(slug: str) -> str:
-    async with httpx.AsyncClient() as client:
-        try:
-            if LANGUAGE == "zh-CN":
-                query_json = {"query": QUESTION_DESC_CN_QUERY,
-                              "variables": {"titleSlug": slug},
-                              "operationName": "questionTranslations"}
-                resp_key = "translatedContent"
-            else:
-                query_json = {
-                    "query": QUESTION_DESC_QUERY,
-                    "variables": {"titleSlug": slug},
-                    "operationName": "questionContent"}
-                resp_key = "content"
-
-            resp = await client.post(LEET_CODE_API_BASE,
-                                     json=query_json,
-                                     timeout=5.0)
-            resp.raise_for_status()
-            return resp.json()['data']['question'][resp_key]
-        except Exception:
-            return "No description found"
+@functools.lru_cache(maxsize=1024)
+def _path_to_problem_id(file_path: str) -> str:
+    return _folder_name_to_problem_id(os.path.basename(os.path.dirname(file_path)))
+
+@functools.lru_cache(maxsize=256)
+def _read_problem_file_version(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+def _read_problem_file(path: str) -> str | None:
+    """Read a local problem markdown, reusing the cached text until the file's mtime changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _read_problem_file_version(path, st.st_mtime_ns)
 
+async def _get_leetcode_question_desc_by_slug(slug: str) -> str:
+    # Cache hits return before the coalescing wrapper, which would allocate a task per call
+    cache_key = (slug, LANGUAGE)
+    if cache_key in STATE.desc_cache:
+        STATE.desc_cache.move_to_end(cache_key)
+        return STATE.desc_cache[cache_key]
+    return await _fetch_question_desc(slug)
+
+@_coalesced("desc")
+async def _fetch_question_desc(slug: str) -> str:
+    try:
+        query_json = {"query": _DESC_QUERY,
+                      "variables": {"titleSlug": slug},
+                      "operationName": _DESC_OPERATION}
+        desc = _text(_field(await _post(query_json), 'data', 'question', _DESC_KEY))
+    except _FETCH_ERRORS:
+        return "No description found"
+    if not desc:
+        return "No description found"
+    _cache_desc(slug, desc)
+    return desc
+
+@_coalesced("article")
 async def _get_leetcode_article(article_slug: str) -> str | None:
-    async with httpx.AsyncClient() as client:
-        try:
-            query_json = {
-                "query": QUESTION_SOLUTION_ARTICLE_CONTENT_QUERY,
-                "variables": {"slug": article_slug},
-                "operationName": "discussTopic"
-            }
-            resp = await client.post(LEET_CODE_API_BASE, json=query_json, timeout=5.0)
-            resp.raise_for_status()
-            article_data = resp.json()['data']['solutionArticle']
-            if article_data and 'content' in article_data:
-                return article_data['content']
-        except Exception:
-            logging.error(f"Error fetching article for slug: {article_slug}", exc_info=True)
+    try:
+        query_json = {
+            "query": QUESTION_SOLUTION_ARTICLE_CONTENT_QUERY,
+            "variables": {"slug": article_slug},
+            "operationName": "discussTopic"
+        }
+        return _text(_field(await _post(query_json), 'data', 'solutionArticle', 'content'))
+    except _FETCH_ERRORS:
+        logging.error(f"Error fetching article for slug: {article_slug}", exc_info=True)
     return None
 
+async def _first_article(article_slugs: list[str]) -> str | None:
+    """Fetch candidate articles concurrently and return the first non-empty content."""
+    tasks = [asyncio.create_task(_get_leetcode_article(article_slug)) for article_slug in article_slugs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            content = await next_done
+            if content:
+                return content
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None
+
+async def _fetch_desc_and_solution(slug: str) -> tuple[str, str | None]:
+    """
+    Fetch the description and the wanted authors' article listings in one request,
+    then resolve the solution article. The description is cached for later desc calls.
+    """
+    query_json = {"query": QUESTION_DESC_AND_ARTICLES_QUERY,
+                  "variables": {"titleSlug": slug, **_AUTHOR_VARIABLES},
+                  "operationName": "questionDescAndArticles"}
+    data = _field(await _post(query_json), "data")
+    desc = _text(_field(data, "question", _DESC_KEY))
+    if desc:
+        _cache_desc(slug, desc)
+    else:
+        desc = "No description found"
+
+    seen = set()
+    matches_by_author = []
+    for i in range(len(WANTED_AUTHORS)):
+        matches = []
+        for article in _field(data, f"articles{i}", "edges") or []:
+            if not isinstance(article, dict):
+                continue  # partial GraphQL errors leave null entries in lists
+            node = _field(article, "node")
+            profile = _field(node, "author", "profile")
+            if (("realName", _field(profile, "realName")) in _WANTED_PROFILES
+                    or ("userSlug", _field(profile, "userSlug")) in _WANTED_PROFILES):
+                article_slug = _text(_field(node, "slug"))
+                if article_slug and article_slug not in seen:
+                    seen.add(article_slug)
+                    matches.append(article_slug)
+        matches_by_author.append(matches)
+
+    # Race each author's best match first, falling back to their later matches if none has content
+    for candidates in itertools.zip_longest(*matches_by_author):
+        content = await _first_article([article_slug for article_slug in candidates if article_slug])
+        if content:
+            return desc, content
+    return desc, None
+
 
 @mcp.tool()
 async def get_leetcode_question_solution_by_problem_id(problem_id: str) -> str:
@@ -295,33 +662,12 @@ async def get_leetcode_question_solution_by_problem_id(problem_id: str) -> str:
     if slug == "No slug found":
         return "No solution article found"
 
-    async with httpx.AsyncClient() as client:
-        for author_name, author_slug in WANTED_AUTHORS:
-            try:
-                query_json = {
-                    "query": QUESTION_SOLUTION_ARTICLE_QUERY,
-                    "variables": {
-                        "questionSlug": slug,
-                        "skip": 0,
-                        "first": 15,
-                        "orderBy": "DEFAULT",
-                        "userInput": author_name,
-                        "tagSlugs": []
-                    },
-                    "operationName": "questionTopicsList"
-                }
-                resp = await client.post(LEET_CODE_API_BASE, json=query_json, timeout=5.0)
-                resp.raise_for_status()
-                articles = resp.json()['data']['questionSolutionArticles']["edges"]
-                for article in articles:
-                    profile = article["node"]["author"]["profile"]
-                    if profile["realName"] == author_name or profile["userSlug"] == author_slug:
-                        content = await _get_leetcode_article(article["node"]["slug"])
-                        if content:
-                            return content
-            except Exception:
-                logging.error(f"Error fetching solution article for {problem_id} by {author_name}", exc_info=True)
-    return "Error fetching solution article"
+    try:
+        _, content = await _fetch_desc_and_solution(slug)
+    except _FETCH_ERRORS:
+        logging.error(f"Error fetching solution article for {problem_id}", exc_info=True)
+        return "Error fetching solution article"
+    return content or "Error fetching solution article"
 
 
 
@@ -333,9 +679,7 @@ async def get_leetcode_question_solution(file_path: str) -> str:
     Args:
         file_path (str): LeetCode problem file path
     """
-    dir_path = Path(file_path).parent
-    problem_id = _folder_name_to_problem_id(dir_path.name)
-    return await get_leetcode_question_solution_by_problem_id(problem_id)
+    return await get_leetcode_question_solution_by_problem_id(_path_to_problem_id(file_path))
 
 
 @mcp.tool()
@@ -346,15 +690,16 @@ async def get_leetcode_question_desc(file_path: str) -> str:
     Args:
         file_path (str): LeetCode problem file path
     """
-    path = Path(file_path)
-    dir_path = path.parent
     problem_file_name = "problem_zh.md" if LANGUAGE == "zh-CN" else "problem.md"
-    problem_file_path = dir_path / problem_file_name
-    if problem_file_path.exists():
-        return problem_file_path.read_text()
+    problem_file_path = os.path.join(os.path.dirname(file_path), problem_file_name)
+    content = await asyncio.to_thread(_read_problem_file, problem_file_path)
+    if content is not None:
+        return content
 
     slug = await find_leetcode_question_slug(file_path)
-    return await get_leetcode_question_desc(slug)
+    if slug == "No slug found":
+        return "No description found"
+    return await _get_leetcode_question_desc_by_slug(slug)
 
 @mcp.tool()
 async def get_leetcode_question_desc_by_problem_id(problem_id: str) -> str:
@@ -367,6 +712,22 @@ async def get_leetcode_question_desc_by_problem_id(problem_id: str) -> str:
     return await _get_leetcode_question_desc_by_slug(problem_id)
 
 
+async def _fetch_page(frontend_problem_id: str, page_no: int) -> tuple[str | None, bool]:
+    query_json = {"query": QUESTION_KEYWORDS_SLIM_QUERY,
+                  "variables": {**_BASE_PAGE_VARIABLES,
+                                "searchKeyword": frontend_problem_id,
+                                "skip": page_no * PAGE_SIZE},
+                  "operationName": "problemsetQuestionListV2"}
+    res_dict = _field(await _post(query_json), "data", "problemsetQuestionListV2")
+    has_more = bool(_field(res_dict, "hasMore"))
+    for question in _field(res_dict, "questions") or []:
+        if not isinstance(question, dict):
+            continue  # partial GraphQL errors leave null entries in lists
+        if question.get("questionFrontendId") == frontend_problem_id:
+            return _text(question.get("titleSlug")), has_more
+    return None, has_more
+
+
 @mcp.tool()
 async def find_leetcode_question_slug_by_problem_id(frontend_problem_id: str) -> str:
     """
@@ -375,69 +736,34 @@ async def find_leetcode_question_slug_by_problem_id(frontend_problem_id: str) ->
     Args:
         frontend_problem_id (str): LeetCode problem ID (e.g., "1", "2", etc.)
     """
+    if frontend_problem_id in STATE.slug_cache:
+        return STATE.slug_cache[frontend_problem_id]
+    return await _search_slug(frontend_problem_id)
+
+@_coalesced("slug")
+async def _search_slug(frontend_problem_id: str) -> str:
     try:
-        page_size, page_no = 100, 0
+        first_page = 0
         while True:
-            filters = {
-                "filterCombineType": "ALL",
-                "statusFilter": {
-                    "questionStatuses": [],
-                    "operator": "IS"
-                },
-                "difficultyFilter": {
-                    "difficulties": [],
-                    "operator": "IS"
-                },
-                "languageFilter": {
-                    "languageSlugs": [],
-                    "operator": "IS"
-                },
-                "topicFilter": {
-                    "topicSlugs": [],
-                    "operator": "IS"
-                },
-                "acceptanceFilter": {},
-                "frequencyFilter": {},
-                "frontendIdFilter": {},
-                "lastSubmittedFilter": {},
-                "publishedFilter": {},
-                "companyFilter": {
-                    "companySlugs": [],
-                    "operator": "IS"
-                },
-                "positionFilter": {
-                    "positionSlugs": [],
-                    "operator": "IS"
-                },
-                "contestPointFilter": {
-                    "contestPoints": [],
-                    "operator": "IS"
-                },
-                "premiumFilter": {
-                    "premiumStatus": [],
-                    "operator": "IS"
-                }
-            }
-            async with httpx.AsyncClient() as client:
-                result = await client.post("https://leetcode.cn/graphql",
-                                           json={"query": QUESTION_KEYWORDS_QUERY,
-                                                 "variables": {
-                                                     "searchKeyword": frontend_problem_id,
-                                                     "categorySlug": "all-code-essentials",
-                                                     "skip": page_no * page_size, "limit": page_size,
-                                                     "filters": filters
-                                                 },
-                                                 "operationName": "problemsetQuestionListV2"},
-                                           timeout=5.0)
-                result.raise_for_status()
-                res_dict = result.json()["data"]["problemsetQuestionListV2"]
-                for question in res_dict["questions"]:
-                    if question["questionFrontendId"] == frontend_problem_id:
-                        return question["titleSlug"]
-                if not res_dict["hasMore"]:
-                    break
-            page_no += 1
-    except Exception as _:
+            tasks = [asyncio.create_task(_fetch_page(frontend_problem_id, page_no))
+                     for page_no in range(first_page, first_page + PAGE_WINDOW)]
+            try:
+                # Pages are awaited in order, so a speculative page past the deciding one
+                # can neither delay the result nor turn it into an error
+                for task in tasks:
+                    title_slug, has_more = await task
+                    if title_slug:
+                        STATE.slug_cache[frontend_problem_id] = title_slug
+                        _persist_cache_record("slugs", frontend_problem_id, title_slug)
+                        return title_slug
+                    if not has_more:
+                        return "No slug found"
+            finally:
+                for task in tasks:
+                    if not task.cancel() and not task.cancelled():
+                        task.exception()  # mark a discarded page's failure as retrieved
+            first_page += PAGE_WINDOW
+    except _FETCH_ERRORS:
         logging.error(f"Error in getting questions by problem id: {frontend_problem_id}", exc_info=True)
     return "No slug found"
 
@@ -449,10 +775,30 @@ async def find_leetcode_question_slug(file_path: str) -> str:
     Args:
         file_path (str): LeetCode problem file path
     """
-    path = Path(file_path)
-    dir_path = path.parent
-    keyword = _folder_name_to_problem_id(dir_path.name)
-    return await find_leetcode_question_slug_by_problem_id(keyword)
+    return await find_leetcode_question_slug_by_problem_id(_path_to_problem_id(file_path))
+
+
+async def _resolve_one(problem_id: str) -> dict[str, str]:
+    slug = await find_leetcode_question_slug_by_problem_id(problem_id)
+    if slug == "No slug found":
+        return {"error": slug}
+    desc, solution = await _fetch_desc_and_solution(slug)
+    return {"desc": desc, "solution": solution or "Error fetching solution article"}
+
+
+@mcp.tool()
+async def get_leetcode_questions_bulk(problem_ids: list[str]) -> dict[str, dict]:
+    """
+    Get problem descriptions and solutions for several problem IDs at once
+
+    Args:
+        problem_ids (list[str]): LeetCode problem IDs (e.g., ["1", "2"])
+    """
+    unique_ids = list(dict.fromkeys(problem_ids))
+    tasks = [asyncio.create_task(_resolve_one(problem_id)) for problem_id in unique_ids]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return {problem_id: {"error": str(result)} if isinstance(result, Exception) else result
+            for problem_id, result in zip(unique_ids, results)}
 
 
 if __name__ == "__main__":